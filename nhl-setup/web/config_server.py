@@ -1,19 +1,64 @@
 import os
+import gzip
+import hashlib
+import http.client
 import json
-import socket
 import logging  
+import mimetypes
 import argparse
-import subprocess 
 import sys
-import shutil
 import re
+import time
+import threading
 import xmlrpc.client
-import urllib.request
-import toml
+import uuid
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import BadRequest
+from werkzeug.security import safe_join
 from richcolorlog import RichColorLogHandler
 
+try:
+    # Optional C-accelerated JSON parser; falls back to the stdlib json module
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional response compression; responses are sent uncompressed without it
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+try:
+    # Optional Brotli encoder for the pre-compressed HTML pages; gzip is always available
+    import brotli
+except ImportError:
+    brotli = None
+
+def _dumps(obj, indent=False):
+    """Serializes obj to UTF-8 JSON bytes, using orjson when available."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+def _loads(data):
+    """Parses JSON from bytes or str, using orjson when available."""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify() and request.json."""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 __version__ = "2025.12.0"
 
 def is_frozen():
@@ -31,6 +76,21 @@ def get_script_dir():
         # For a normal script, it's the directory of the __file__.
         return os.path.dirname(os.path.abspath(__file__))
 
+def load_toml(path):
+    """
+    Parses a TOML file with the stdlib tomllib (Python 3.11+),
+    falling back to the pure-Python toml package on older interpreters.
+    Imported here since the TOML parser is only needed once, at startup.
+    """
+    try:
+        import tomllib
+    except ImportError:
+        import toml
+        with open(path, 'r') as f:
+            return toml.load(f)
+    with open(path, 'rb') as f:
+        return tomllib.load(f)
+
 # --- Command-Line Argument Parsing ---
 parser = argparse.ArgumentParser(description='Flask server for the NHL LED Scoreboard Control Hub.')
 parser.add_argument(
@@ -102,6 +162,8 @@ else:
 SUPERVISOR_URL = '127.0.0.1'
 SUPERVISOR_PORT = 9001
 SCOREBOARD_DIR = '.'
+# Hand /assets/ off to a front-end nginx via X-Accel-Redirect instead of reading files in Python
+USE_XSENDFILE = False
 
 # Determine config path: command line > default path
 if args.config:
@@ -112,24 +174,24 @@ else:
 # Load from config.toml if it exists
 if os.path.exists(CONFIG_TOML_PATH):
     try:
-        with open(CONFIG_TOML_PATH, 'r') as f:
-            toml_config = toml.load(f)
-        logging.info(f"Successfully loaded configuration from [green]{CONFIG_TOML_PATH}[/green]")
+        toml_config = load_toml(CONFIG_TOML_PATH)
+        logging.info("Successfully loaded configuration from [green]%s[/green]", CONFIG_TOML_PATH)
     except Exception as e:
-        logging.error(f"Failed to load configuration from [red]{CONFIG_TOML_PATH}[/red]: {e}")
+        logging.error("Failed to load configuration from [red]%s[/red]: %s", CONFIG_TOML_PATH, e)
         # Keep empty toml_config, defaults will be used
 else:
     # Only log 'not found' if the default path was used
     if not args.config:
-        logging.info(f"Using default configuration as {CONFIG_TOML_PATH} was not found.")
+        logging.info("Using default configuration as %s was not found.", CONFIG_TOML_PATH)
     else:
-        logging.error(f"Specified config file not found at [red]{CONFIG_TOML_PATH}[/red].")
+        logging.error("Specified config file not found at [red]%s[/red].", CONFIG_TOML_PATH)
     
 # Apply configurations from TOML file
 PORT = toml_config.get('PORT', PORT)
 PYTHON_EXEC = toml_config.get('PYTHON_EXEC', PYTHON_EXEC)
 SUPERVISOR_URL = toml_config.get('SUPERVISOR_URL', SUPERVISOR_URL)
 SUPERVISOR_PORT = toml_config.get('SUPERVISOR_PORT', SUPERVISOR_PORT)
+USE_XSENDFILE = toml_config.get('USE_XSENDFILE', USE_XSENDFILE)
 
 # scoreboard_dir from config is used if the command-line arg is not provided
 if args.scoreboard_dir is None:
@@ -155,6 +217,7 @@ CONFIG_FILE = 'config.json'
 CONFIG_PATH = os.path.join(CONFIG_DIR, CONFIG_FILE)
 VERSION_FILE = os.path.join(SCOREBOARD_DIR, 'VERSION')
 PLUGINS_INDEX_FILE = os.path.join(SCOREBOARD_DIR, 'plugins_index.json')
+PLUGINS_INDEX_META_FILE = f"{PLUGINS_INDEX_FILE}.meta.json"
 PLUGINS_INSTALLED_FILE = os.path.join(SCOREBOARD_DIR, 'plugins.json')
 PLUGINS_EXAMPLE_FILE = os.path.join(SCOREBOARD_DIR, 'plugins.json.example')
 PLUGINS_LOCK_FILE = os.path.join(SCOREBOARD_DIR, 'plugins.lock.json')
@@ -166,6 +229,17 @@ SETUP_FILE = '/home/pi/.nhlledportal/SETUP'
 
 # --- Flask App Initialization ---
 app = Flask(__name__, template_folder=TEMPLATES_DIR, static_folder=ASSETS_DIR)
+if orjson:
+    app.json = OrjsonProvider(app)
+# Let browsers cache files from send_from_directory for a week
+ASSET_MAX_AGE = 604800
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = ASSET_MAX_AGE
+# Compress API responses on the fly; HTML pages are pre-compressed at startup instead
+if Compress:
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_LEVEL'] = 6
+    app.config['COMPRESS_MIN_SIZE'] = 500
+    Compress(app)
 
 
 # The root logger is configured by basicConfig.
@@ -178,9 +252,73 @@ app.logger.setLevel(log_level)
 
 
 # --- Helper Functions ---
+# Header row printed by 'plugins.py list'
+_HEADER_RE = re.compile(r"NAME\s+VERSION\s+STATUS\s+COMMIT")
+
+# Parsed JSON files keyed by path: {path: ((st_ino, st_mtime_ns, st_size), data)}
+_json_cache = {}
+
+def load_json_cached(path):
+    """
+    Loads a JSON file, re-parsing it only when its inode, mtime or size has changed.
+    Writers replace these files atomically, so a new inode catches same-size rewrites
+    within one timestamp tick.
+    The returned object is shared between callers and must not be modified.
+    """
+    st = os.stat(path)
+    key = (st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _json_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    with open(path, 'rb') as f:
+        data = _loads(f.read())
+    _json_cache[path] = (key, data)
+    return data
+
+def _copy_file(src, dst):
+    """Copies src to dst with sendfile(2) so the data never leaves kernel space."""
+    with open(src, 'rb') as s, open(dst, 'wb') as d:
+        offset = 0
+        remaining = os.fstat(s.fileno()).st_size
+        while remaining > 0:
+            sent = os.sendfile(d.fileno(), s.fileno(), offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+
+# Names of the files in SCOREBOARD_DIR from one os.scandir(), rescanned every
+# SCOREBOARD_FILES_TTL seconds or after this server writes into the directory
+SCOREBOARD_FILES_TTL = 2
+_scoreboard_files = {'time': None, 'names': frozenset()}
+
+def scoreboard_file_exists(path):
+    """Checks whether a file directly inside SCOREBOARD_DIR exists, using the cached directory listing."""
+    now = time.monotonic()
+    if _scoreboard_files['time'] is None or now - _scoreboard_files['time'] >= SCOREBOARD_FILES_TTL:
+        try:
+            with os.scandir(SCOREBOARD_DIR) as entries:
+                names = frozenset(entry.name for entry in entries)
+        except OSError:
+            names = frozenset()
+        _scoreboard_files.update(time=now, names=names)
+    return os.path.basename(path) in _scoreboard_files['names']
+
+def invalidate_scoreboard_files():
+    """Forces the next scoreboard_file_exists() call to rescan SCOREBOARD_DIR."""
+    _scoreboard_files['time'] = None
+
+# Result of the last SETUP file check, reused for FIRST_RUN_CHECK_TTL seconds
+FIRST_RUN_CHECK_TTL = 2
+_first_run_check = {'time': None, 'first_run': False}
+
 def check_first_run():
     """Checks if the first-run SETUP file exists."""
-    return os.path.exists(SETUP_FILE)
+    now = time.monotonic()
+    if _first_run_check['time'] is None or now - _first_run_check['time'] >= FIRST_RUN_CHECK_TTL:
+        _first_run_check.update(time=now, first_run=os.path.exists(SETUP_FILE))
+    return _first_run_check['first_run']
 
 # =============================================
 # MODIFIED: check_and_create_installed_plugins_file
@@ -195,52 +333,57 @@ def check_and_create_installed_plugins_file():
     """
     should_restore = False
     
-    if not os.path.exists(PLUGINS_INSTALLED_FILE):
-        app.logger.warning(f"{PLUGINS_INSTALLED_FILE} not found.")
+    if not scoreboard_file_exists(PLUGINS_INSTALLED_FILE):
+        app.logger.warning("%s not found.", PLUGINS_INSTALLED_FILE)
         should_restore = True
     else:
         try:
-            with open(PLUGINS_INSTALLED_FILE, 'r') as f:
-                content = f.read().strip()
-                if not content:
-                    # File is 0 bytes
-                    app.logger.warning(f"{PLUGINS_INSTALLED_FILE} is empty.")
+            if os.path.getsize(PLUGINS_INSTALLED_FILE) == 0:
+                app.logger.warning("%s is empty.", PLUGINS_INSTALLED_FILE)
+                should_restore = True
+            else:
+                data = load_json_cached(PLUGINS_INSTALLED_FILE)
+                # Check if 'plugins' key is missing or empty list
+                if not data.get('plugins'):
+                    app.logger.info("%s exists but has no plugins. Restoring defaults.", PLUGINS_INSTALLED_FILE)
                     should_restore = True
-                else:
-                    # Parse JSON
-                    data = json.loads(content)
-                    # Check if 'plugins' key is missing or empty list
-                    if not data.get('plugins'):
-                        app.logger.info(f"{PLUGINS_INSTALLED_FILE} exists but has no plugins. Restoring defaults.")
-                        should_restore = True
         except Exception as e:
-            app.logger.warning(f"Error validating {PLUGINS_INSTALLED_FILE}: {e}. Will attempt restore.")
+            app.logger.warning("Error validating %s: %s. Will attempt restore.", PLUGINS_INSTALLED_FILE, e)
             should_restore = True
 
     if should_restore:
-        if os.path.exists(PLUGINS_EXAMPLE_FILE):
+        if scoreboard_file_exists(PLUGINS_EXAMPLE_FILE):
             try:
-                app.logger.info(f"Copying {PLUGINS_EXAMPLE_FILE} to {PLUGINS_INSTALLED_FILE}...")
-                shutil.copy(PLUGINS_EXAMPLE_FILE, PLUGINS_INSTALLED_FILE)
+                app.logger.info("Copying %s to %s...", PLUGINS_EXAMPLE_FILE, PLUGINS_INSTALLED_FILE)
+                _copy_file(PLUGINS_EXAMPLE_FILE, PLUGINS_INSTALLED_FILE)
+                invalidate_scoreboard_files()
                 app.logger.info("Plugins file restored.")
             except Exception as e:
-                app.logger.error(f"Failed to copy example plugins file: {e}")
+                app.logger.error("Failed to copy example plugins file: %s", e)
         else:
-            app.logger.warning(f"{PLUGINS_EXAMPLE_FILE} not found. Cannot create plugins.json.")
+            app.logger.warning("%s not found. Cannot create plugins.json.", PLUGINS_EXAMPLE_FILE)
 # =============================================
 
+# Last version read from VERSION_FILE, keyed on the file's mtime
+_version_cache = {'mtime': None, 'version': None}
+
 def get_version():
     """Reads the version from the VERSION file and prepends 'V' if missing."""
     try:
+        mtime = os.stat(VERSION_FILE).st_mtime_ns
+        if mtime == _version_cache['mtime']:
+            return _version_cache['version']
+
         with open(VERSION_FILE, 'r') as f:
             version = f.read().strip()
             if not version.upper().startswith('V'):
                 version = f"V{version}"
-            return version
+        _version_cache.update(mtime=mtime, version=version)
+        return version
     except FileNotFoundError:
         return "Unknown"
     except Exception as e:
-        app.logger.error(f"Error reading {VERSION_FILE}: {e}")
+        app.logger.error("Error reading %s: %s", VERSION_FILE, e)
         return "Error"
 
 def get_plugin_boards():
@@ -251,78 +394,122 @@ def get_plugin_boards():
     
     board_names = []
     try:
-        with open(PLUGINS_INSTALLED_FILE, 'r') as f:
-            data = json.load(f)
-            # Check if 'plugins' key exists and is a list
-            if 'plugins' in data and isinstance(data['plugins'], list):
-                for plugin in data['plugins']:
-                    # Get the name from each plugin object
-                    if 'name' in plugin:
-                        board_names.append(plugin['name'])
-                app.logger.info(f"Loaded {len(board_names)} plugin boards: {board_names}")
-            else:
-                app.logger.warning(f"{PLUGINS_INSTALLED_FILE} is missing 'plugins' key or it's not a list.")
+        data = load_json_cached(PLUGINS_INSTALLED_FILE)
+        # Check if 'plugins' key exists and is a list
+        if 'plugins' in data and isinstance(data['plugins'], list):
+            for plugin in data['plugins']:
+                # Get the name from each plugin object
+                if 'name' in plugin:
+                    board_names.append(plugin['name'])
+            app.logger.info("Loaded %s plugin boards: %s", len(board_names), board_names)
+        else:
+            app.logger.warning("%s is missing 'plugins' key or it's not a list.", PLUGINS_INSTALLED_FILE)
     except FileNotFoundError:
-        app.logger.info(f"{PLUGINS_INSTALLED_FILE} not found, no custom boards loaded.")
+        app.logger.info("%s not found, no custom boards loaded.", PLUGINS_INSTALLED_FILE)
     except json.JSONDecodeError:
-        app.logger.error(f"Could not decode {PLUGINS_INSTALLED_FILE}. Check for JSON syntax errors.")
+        app.logger.error("Could not decode %s. Check for JSON syntax errors.", PLUGINS_INSTALLED_FILE)
     except Exception as e:
-        app.logger.error(f"Error reading {PLUGINS_INSTALLED_FILE}: {e}")
+        app.logger.error("Error reading %s: %s", PLUGINS_INSTALLED_FILE, e)
     
     return board_names
 
+# How long the check waits for a Supervisor call in another request (e.g. a slow
+# stopProcess) before giving up and reporting the last known state
+SUPERVISOR_CHECK_LOCK_TIMEOUT = 0.5
+# Result of the last Supervisor liveness check that got through
+_supervisor_check = {'available': False}
+
 def check_supervisor():
-    """Checks if the Supervisor web UI is running on its port."""
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.settimeout(1) # 1 second timeout
+    """
+    Checks if Supervisor answers on its XML-RPC interface.
+    Returns (available, checked); checked is False if another request held the
+    connection for too long and available is only the last known state.
+    """
+    if not _SUPERVISOR_LOCK.acquire(timeout=SUPERVISOR_CHECK_LOCK_TIMEOUT):
+        return _supervisor_check['available'], False
     try:
-        result = sock.connect_ex((SUPERVISOR_URL, SUPERVISOR_PORT))
-        return result == 0
-    except socket.error as e:
-        app.logger.warning(f"Supervisor check failed: {e}")
-        return False
+        _SUPERVISOR.supervisor.getState()
+        available = True
+    except Exception as e:
+        app.logger.debug("Supervisor check failed: %s", e)
+        available = False
     finally:
-        sock.close()
+        _SUPERVISOR_LOCK.release()
+    _supervisor_check['available'] = available
+    return available, True
 
 def run_shell_script(command_list, timeout=120):
     """Helper function to run a generic shell script."""
-    app.logger.info(f"Running shell command: {' '.join(command_list)} in [bold]{SCOREBOARD_DIR}[/bold]")
+    import subprocess
+    app.logger.info("Running shell command: %s in [bold]%s[/bold]", ' '.join(command_list), SCOREBOARD_DIR)
     try:
-        process = subprocess.Popen(
+        process = subprocess.run(
             command_list, 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE, 
+            capture_output=True, 
             text=True, 
             encoding='utf-8',
-            cwd=SCOREBOARD_DIR
+            cwd=SCOREBOARD_DIR,
+            timeout=timeout
         )
-        stdout, stderr = process.communicate(timeout=timeout)
-        full_output = stdout + "\n" + stderr
+        full_output = process.stdout + "\n" + process.stderr if process.stderr else process.stdout
         
         if process.returncode == 0:
-            app.logger.info(f"Shell command {' '.join(command_list)} ran successfully.")
+            app.logger.info("Shell command %s ran successfully.", ' '.join(command_list))
             return {'success': True, 'output': full_output}
         else:
-            app.logger.warning(f"Shell command {' '.join(command_list)} failed.")
+            app.logger.warning("Shell command %s failed.", ' '.join(command_list))
             return {'success': False, 'output': full_output}
             
     except subprocess.TimeoutExpired:
         app.logger.error("Shell command timed out.")
         return {'success': False, 'output': f'Error: Script timed out after {timeout} seconds.'}
     except Exception as e:
-        app.logger.error(f"An unexpected error occurred while running shell command: {e}")
+        app.logger.error("An unexpected error occurred while running shell command: %s", e)
         return {'success': False, 'output': f'An unexpected error occurred: {e}'}
 
 def run_plugin_script(args_list, timeout=300):
     """Helper function to run the plugins.py script with given args."""
-    if not os.path.exists(PLUGINS_SCRIPT):
-        app.logger.error(f"Plugin script not found at {PLUGINS_SCRIPT}")
+    if not scoreboard_file_exists(PLUGINS_SCRIPT):
+        app.logger.error("Plugin script not found at %s", PLUGINS_SCRIPT)
         return {'success': False, 'output': f'Error: Script not found at {PLUGINS_SCRIPT}'}
         
     command = [PYTHON_EXEC, PLUGINS_SCRIPT] + args_list
     # Call the generic helper, which runs from SCOREBOARD_DIR
     return run_shell_script(command, timeout=timeout)
 
+# Long-running scripts run here so they don't tie up a request thread.
+# Jobs are kept in _JOBS as {'future': Future, 'finished': monotonic time or None} until the
+# front-end collects the result from /api/jobs/<job_id>, or for JOB_RESULT_TTL seconds after
+# finishing if nobody does (e.g. the tab was closed).
+_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+_JOBS = {}
+JOB_RESULT_TTL = 300
+
+def prune_jobs():
+    """Forgets finished jobs whose results were not collected within JOB_RESULT_TTL."""
+    now = time.monotonic()
+    for job_id, job in list(_JOBS.items()):
+        if job['finished'] is not None and now - job['finished'] > JOB_RESULT_TTL:
+            _JOBS.pop(job_id, None)
+            app.logger.debug("Dropped uncollected result of background job %s", job_id)
+
+def submit_job(fn, *fn_args, **fn_kwargs):
+    """Runs fn in the background pool and returns a 202 response carrying its job id."""
+    prune_jobs()
+    job_id = uuid.uuid4().hex
+    job = {'future': None, 'finished': None}
+
+    def on_done(future):
+        job['finished'] = time.monotonic()
+        # plugins.py adds and removes files in SCOREBOARD_DIR
+        invalidate_scoreboard_files()
+
+    job['future'] = _EXECUTOR.submit(fn, *fn_args, **fn_kwargs)
+    job['future'].add_done_callback(on_done)
+    _JOBS[job_id] = job
+    app.logger.info("Started background job %s", job_id)
+    return jsonify({'success': True, 'job_id': job_id}), 202
+
 def parse_plugin_list_output(output):
     """Parses the text table from 'plugins.py list'."""
     plugin_statuses = {}
@@ -334,8 +521,8 @@ def parse_plugin_list_output(output):
 
     # Verify header line exists
     header = lines[0]
-    if not re.search(r"NAME\s+VERSION\s+STATUS\s+COMMIT", header):
-        app.logger.error(f"Could not parse 'plugins.py list' header. Got: {header}")
+    if not _HEADER_RE.search(header):
+        app.logger.error("Could not parse 'plugins.py list' header. Got: %s", header)
         return plugin_statuses
 
     # Parse data lines (skip header at index 0 and separator line at index 1)
@@ -344,15 +531,16 @@ def parse_plugin_list_output(output):
             continue
 
         try:
-            # Split by whitespace - this handles variable spacing better than fixed positions
-            parts = line.split()
+            # Split by whitespace - this handles variable spacing better than fixed positions.
+            # Stop after the commit column; the padded tail is stripped below.
+            parts = line.split(None, 3)
 
             # We expect at least 4 parts: name, version, status, commit
             if len(parts) >= 4:
                 name = parts[0]
                 version = parts[1]
                 status = parts[2]
-                commit = parts[3]
+                commit = parts[3].rstrip()
 
                 plugin_statuses[name] = {
                     "version": version,
@@ -360,92 +548,185 @@ def parse_plugin_list_output(output):
                     "commit": commit
                 }
             else:
-                app.logger.warning(f"Could not parse plugin list line (expected 4 columns, got {len(parts)}): '{line}'")
+                app.logger.warning("Could not parse plugin list line (expected 4 columns, got %s): '%s'",
+                                   len(parts), line)
 
         except Exception as e:
-            app.logger.warning(f"Could not parse plugin list line: '{line}'. Error: {e}")
+            app.logger.warning("Could not parse plugin list line: '%s'. Error: %s", line, e)
 
     return plugin_statuses
 
 # --- API Endpoints ---
 
+# Serialized /api/status response, rebuilt at most every STATUS_CACHE_TTL seconds
+STATUS_CACHE_TTL = 5
+_status_cache = {'time': None, 'blob': None, 'etag': None}
+
+# Base list (as requested, "holiday_countdown" is removed)
+BASE_BOARDS = [
+    "wxalert", "wxforecast", "scoreticker", "seriesticker", "standings",
+    "team_summary", "stanley_cup_champions", "christmas",
+    "season_countdown", "clock", "weather", "player_stats", "ovi_tracker", "stats_leaders"
+]
+
+def board_option(name):
+    """Creates the {value, display name} object format the front-end expects for a board."""
+    return {"v": name, "n": name.replace("_", " ").title()}
+
+# The base boards never change, so their options are built once at import
+BASE_BOARD_OPTIONS = [board_option(name) for name in BASE_BOARDS]
+
+# Serialized /api/boards response, keyed on the mtime of plugins.json
+_boards_cache = {'mtime': None, 'blob': None, 'etag': None}
+
+def blob_etag(blob):
+    """Returns a short content hash of a response body for use as its ETag."""
+    return hashlib.blake2b(blob, digest_size=8).hexdigest()
+
+def json_blob_response(blob, etag):
+    """
+    Serves a pre-serialized JSON body with its ETag, or an empty
+    304 Not Modified if the client's If-None-Match already matches.
+    """
+    response = Response(blob, mimetype='application/json')
+    response.set_etag(etag)
+    # Cacheable, but the browser must revalidate before each use
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
 @app.route('/api/status')
 def api_status():
     """Provides version and supervisor status to the front-end."""
-    
+    now = time.monotonic()
+    if _status_cache['time'] is not None and now - _status_cache['time'] < STATUS_CACHE_TTL:
+        return json_blob_response(_status_cache['blob'], _status_cache['etag'])
+
+    supervisor_status, checked = check_supervisor()
     # Override supervisor check if debug flag is set
-    supervisor_status = check_supervisor() or args.debug
+    supervisor_status = supervisor_status or args.debug
     
-    return jsonify({
+    blob = _dumps({
         'version': get_version(),
         'control_hub_version': __version__,
         'supervisor_available': supervisor_status
     })
+    etag = blob_etag(blob)
+    # A guessed Supervisor state is not worth keeping; check again on the next request
+    if checked:
+        _status_cache.update(time=now, blob=blob, etag=etag)
+    return json_blob_response(blob, etag)
 
 @app.route('/api/boards')
 def api_boards():
     """Provides a list of all available boards (built-in + plugins)."""
-    
-    # Base list (as requested, "holiday_countdown" is removed)
-    base_boards_list = [
-        "wxalert", "wxforecast", "scoreticker", "seriesticker", "standings",
-        "team_summary", "stanley_cup_champions", "christmas",
-        "season_countdown", "clock", "weather", "player_stats", "ovi_tracker", "stats_leaders"
-    ]
+    try:
+        mtime = os.stat(PLUGINS_INSTALLED_FILE).st_mtime_ns
+    except OSError:
+        mtime = None
+    if mtime is not None and mtime == _boards_cache['mtime']:
+        return json_blob_response(_boards_cache['blob'], _boards_cache['etag'])
     
     # Get custom boards from plugins.json
     plugin_boards = get_plugin_boards()
     
-    # Combine and return the lists
-    all_boards = base_boards_list + plugin_boards
-    
-    # Create the object format the front-end expects
-    board_options = [{"v": name, "n": name.replace("_", " ").title()} for name in all_boards]
-    
-    return jsonify(board_options)
+    # Combine the prebuilt base options with the plugin boards
+    board_options = BASE_BOARD_OPTIONS + [board_option(name) for name in plugin_boards]
+    blob = _dumps(board_options)
+    etag = blob_etag(blob)
+
+    # get_plugin_boards() may have restored plugins.json, so key on its current mtime
+    try:
+        _boards_cache.update(mtime=os.stat(PLUGINS_INSTALLED_FILE).st_mtime_ns, blob=blob, etag=etag)
+    except OSError:
+        _boards_cache.update(mtime=None, blob=None, etag=None)
+
+    return json_blob_response(blob, etag)
+
+@app.route('/api/jobs/<job_id>')
+def api_job_status(job_id):
+    """Reports whether a background job has finished and returns its result once it has."""
+    prune_jobs()
+    job = _JOBS.get(job_id)
+    if job is None:
+        return jsonify({'done': True, 'result': {'success': False, 'output': f'Error: Unknown job {job_id}.'}}), 404
+    future = job['future']
+    if not future.done():
+        return jsonify({'done': False, 'result': None})
+
+    # The result is handed out once, then the job is forgotten
+    _JOBS.pop(job_id, None)
+    try:
+        result = future.result()
+    except Exception as e:
+        app.logger.error("Background job %s failed: %s", job_id, e)
+        result = {'success': False, 'output': f'An unexpected error occurred: {e}'}
+    return jsonify({'done': True, 'result': result})
 
 @app.route('/load', methods=['GET'])
 def load_config():
     """Reads the existing config.json file and returns it."""
     try:
         if not os.path.exists(CONFIG_PATH):
-            app.logger.warning(f"Load request failed: {CONFIG_FILE} not found.")
+            app.logger.warning("Load request failed: %s not found.", CONFIG_FILE)
             return jsonify({'success': False, 'message': 'config.json not found.'}), 404
             
-        app.logger.info(f"Loading config from: {CONFIG_PATH}")
-        with open(CONFIG_PATH, 'r') as f:
-            data = json.load(f)
+        app.logger.info("Loading config from: %s", CONFIG_PATH)
+        data = load_json_cached(CONFIG_PATH)
         return jsonify({'success': True, 'config': data})
 
     except Exception as e:
-        app.logger.error(f"Error loading config: {e}")
+        app.logger.error("Error loading config: %s", e)
         return jsonify({'success': False, 'message': f"An error occurred: {e}"}), 500
 
 @app.route('/save', methods=['POST'])
 def save_config():
     """Saves the config.json file and creates a backup."""
     try:
-        data_string = request.data.decode('utf-8')
+        # Parse the body once, whatever its Content-Type; it is not needed again
+        valid_json = request.get_json(force=True, cache=False)
+    except BadRequest as e:
+        # Outside debug mode Flask re-raises a bare BadRequest from the one carrying the
+        # parser's message ("Failed to decode JSON object: ...")
+        reason = getattr(e.__cause__, 'description', e.description)
+        app.logger.error("Error saving config: %s", reason)
+        return jsonify({'success': False, 'message': f"Invalid JSON: {reason}"}), 400
+    try:
         if not os.path.exists(CONFIG_DIR):
-            app.logger.info(f"Creating directory: {CONFIG_DIR}")
+            app.logger.info("Creating directory: %s", CONFIG_DIR)
             os.makedirs(CONFIG_DIR)
         if os.path.exists(CONFIG_PATH):
             timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
             backup_path = f"{CONFIG_PATH}.{timestamp}.bak"
-            app.logger.info(f"Backing up existing config to: {backup_path}")
-            os.rename(CONFIG_PATH, backup_path)
-        app.logger.info(f"Saving new config to: {CONFIG_PATH}")
-        with open(CONFIG_PATH, 'w') as f:
-            valid_json = json.loads(data_string)
-            json.dump(valid_json, f, indent=2)
+            app.logger.info("Backing up existing config to: %s", backup_path)
+            # Hardlink the current file as the backup; os.replace below swaps in a new inode.
+            # The link goes via a temporary name so a second save in the same second
+            # replaces that second's backup, as os.rename did, instead of failing.
+            # Temporary names are unique per save, as saves can run concurrently.
+            backup_tmp_path = f"{backup_path}.{uuid.uuid4().hex}.tmp"
+            try:
+                os.link(CONFIG_PATH, backup_tmp_path)
+            except OSError:
+                # Filesystems without hard links get a copy instead
+                _copy_file(CONFIG_PATH, backup_tmp_path)
+            os.replace(backup_tmp_path, backup_path)
+            if os.path.lexists(backup_tmp_path):
+                # rename(2) does nothing if a concurrent save already linked the same file there
+                os.remove(backup_tmp_path)
+        app.logger.info("Saving new config to: %s", CONFIG_PATH)
+        tmp_path = f"{CONFIG_PATH}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps(valid_json, indent=True))
+        os.replace(tmp_path, CONFIG_PATH)
         return jsonify({'success': True, 'message': f"Config saved to {CONFIG_PATH}. Backup of old file created."})
     except Exception as e:
-        app.logger.error(f"Error saving config: {e}")
+        app.logger.error("Error saving config: %s", e)
         return jsonify({'success': False, 'message': f"An error occurred: {e}"}), 500
 
 @app.route('/api/mqtt-test', methods=['POST'])
 def mqtt_test():
-    """Runs the mqtt_test.py script."""
+    """Tests the connection to an MQTT broker."""
+    from mqtt_test import mqtt_reachable
+
     data = request.json
     broker = data.get('broker')
     port = data.get('port')
@@ -455,43 +736,36 @@ def mqtt_test():
     if not broker or not port:
         return jsonify({'success': False, 'output': 'Error: "broker" and "port" are required.'}), 400
 
-    # The mqtt_test.py script is in the same directory as this server file (SCRIPT_DIR)
-    script_path = os.path.join(SCRIPT_DIR, 'mqtt_test.py')
-    if not os.path.exists(script_path):
-        app.logger.error(f"Script not found at {script_path}")
-        return jsonify({'success': False, 'output': f'Error: Script not found at {script_path}'}), 404
+    try:
+        port = int(port)
+    except (TypeError, ValueError):
+        return jsonify({'success': False, 'output': 'Error: "port" must be a number.'}), 400
 
-    command = [PYTHON_EXEC, script_path, broker, str(port)]
-    if username and password:
-        command.extend(['-u', username, '-p', password])
+    # Runs in-process rather than via the mqtt_test.py CLI, saving an interpreter start per test
+    try:
+        reachable = mqtt_reachable(broker, port, username, password)
+    except RuntimeError as e:
+        app.logger.error("MQTT test failed: %s", e)
+        return jsonify({'success': False, 'output': f'Error: {e}'}), 500
 
-    # Use the generic run_shell_script helper which executes from SCOREBOARD_DIR
-    result = run_shell_script(command, timeout=30)
-    
-    # The mqtt_test.py script prints "yes" or "no".
-    # We need to check the output for the word "yes" for success.
-    if result['success'] and 'yes' in result['output'].lower():
-        return jsonify({'success': True, 'output': result['output']})
-    else:
-        # If the script failed or didn't return "yes", it's a failure.
-        return jsonify({'success': False, 'output': result['output']})
+    # Same "yes"/"no" output the mqtt_test.py script prints
+    return jsonify({'success': reachable, 'output': "yes" if reachable else "no"})
 
 
 @app.route('/api/run-issue-uploader', methods=['POST'])
 def run_issue_uploader():
-    """Runs the issue_upload.py script and returns its output."""
+    """Starts the issue_upload.py script as a background job."""
     app.logger.info("Request received to run issue uploader script...")
     # The script is in the same directory as this server file
     script_path = os.path.join(SCRIPT_DIR, 'issue_upload.py')
     
     if not os.path.exists(script_path):
-        app.logger.error(f"Script not found at {script_path}")
+        app.logger.error("Script not found at %s", script_path)
         return jsonify({'success': False, 'output': f'Error: Script not found at {script_path}'}), 404
     
-    # Call the generic run_shell_script helper to execute the python script
+    # Run the generic run_shell_script helper in the background to execute the python script
     # PYTHON_EXEC is defined above as sys.executable
-    result = run_shell_script([PYTHON_EXEC, script_path, '--scoreboard_dir', SCOREBOARD_DIR], timeout=180)
-    return jsonify(result)
+    return submit_job(run_shell_script, [PYTHON_EXEC, script_path, '--scoreboard_dir', SCOREBOARD_DIR], timeout=180)
 
 # =============================================
 # Plugin Management API Endpoints
@@ -501,28 +775,65 @@ def download_plugins_index(force=False):
     """
     Downloads the plugins_index.json file.
     If force is False, it will only download if the file doesn't exist.
-    If force is True, it will overwrite the existing file.
+    If force is True, it will overwrite the existing file, using the ETag and
+    Last-Modified saved from the previous download to skip unchanged files,
+    as long as the local file is still the one that was downloaded.
     """
+    import urllib.error
+    import urllib.request
+
     PLUGINS_INDEX_URL = "https://raw.githubusercontent.com/falkyre/nhl-led-scoreboard/main/plugins_index.json"
     
-    if not force and os.path.exists(PLUGINS_INDEX_FILE):
-        app.logger.info(f"{PLUGINS_INDEX_FILE} already exists. Skipping download.")
+    if not force and scoreboard_file_exists(PLUGINS_INDEX_FILE):
+        app.logger.info("%s already exists. Skipping download.", PLUGINS_INDEX_FILE)
         return {'success': True, 'message': 'Plugin index already exists.'}
 
-    app.logger.info(f"Downloading plugin index from {PLUGINS_INDEX_URL}...")
+    # Validators from the last download, only usable if the index is still exactly the file
+    # that was downloaded; a git pull or hand edit may have replaced it since
+    meta = {}
+    try:
+        st = os.stat(PLUGINS_INDEX_FILE)
+        meta = load_json_cached(PLUGINS_INDEX_META_FILE)
+        if meta.get('size') != st.st_size or meta.get('mtime_ns') != st.st_mtime_ns:
+            meta = {}
+    except Exception:
+        meta = {}
+
+    request_obj = urllib.request.Request(PLUGINS_INDEX_URL)
+    if meta.get('etag'):
+        request_obj.add_header('If-None-Match', meta['etag'])
+    if meta.get('last_modified'):
+        request_obj.add_header('If-Modified-Since', meta['last_modified'])
+
+    app.logger.info("Downloading plugin index from %s...", PLUGINS_INDEX_URL)
     try:
-        with urllib.request.urlopen(PLUGINS_INDEX_URL) as response:
+        with urllib.request.urlopen(request_obj) as response:
             if response.status == 200:
                 data = response.read()
                 with open(PLUGINS_INDEX_FILE, 'wb') as f:
                     f.write(data)
-                app.logger.info(f"Successfully downloaded and saved {PLUGINS_INDEX_FILE}")
+                st = os.stat(PLUGINS_INDEX_FILE)
+                with open(PLUGINS_INDEX_META_FILE, 'wb') as f:
+                    f.write(_dumps({
+                        'etag': response.headers.get('ETag'),
+                        'last_modified': response.headers.get('Last-Modified'),
+                        'size': st.st_size,
+                        'mtime_ns': st.st_mtime_ns
+                    }))
+                invalidate_scoreboard_files()
+                app.logger.info("Successfully downloaded and saved %s", PLUGINS_INDEX_FILE)
                 return {'success': True, 'message': 'Plugin index downloaded successfully.'}
             else:
-                app.logger.error(f"Failed to download plugin index. Status code: {response.status}")
+                app.logger.error("Failed to download plugin index. Status code: %s", response.status)
                 return {'success': False, 'message': f"Failed to download. Status: {response.status}"}
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            app.logger.info("%s is already up to date.", PLUGINS_INDEX_FILE)
+            return {'success': True, 'message': 'Plugin index is already up to date.'}
+        app.logger.error("Error downloading plugin index: %s", e)
+        return {'success': False, 'message': f"An error occurred: {e}"}
     except Exception as e:
-        app.logger.error(f"Error downloading plugin index: {e}")
+        app.logger.error("Error downloading plugin index: %s", e)
         return {'success': False, 'message': f"An error occurred: {e}"}
 
 @app.route('/api/plugins/refresh', methods=['POST'])
@@ -532,43 +843,66 @@ def refresh_plugins_index():
     result = download_plugins_index(force=True)
     return jsonify(result)
 
+# Last merged plugin list, reused for PLUGIN_STATUS_TTL seconds while the plugin files are unchanged
+PLUGIN_STATUS_TTL = 30
+_plugin_status_cache = {'key': None, 'time': None, 'plugins': None}
+
+def plugin_files_key():
+    """Returns the mtimes of the files that 'plugins.py list' and the status merge depend on."""
+    key = []
+    for path in (PLUGINS_INDEX_FILE, PLUGINS_INSTALLED_FILE, PLUGINS_LOCK_FILE):
+        if not scoreboard_file_exists(path):
+            # Skip the stat for files the directory listing says are absent
+            key.append(None)
+            continue
+        try:
+            key.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            key.append(None)
+    return tuple(key)
+
 @app.route('/api/plugins/status', methods=['GET'])
 def get_plugin_status():
     """
     Reads plugins_index.json (for available plugins), plugins.json (for installed plugins),
     and runs 'plugins.py list' (for live status), returning a merged list.
+    The merged list is cached until a plugin file changes or PLUGIN_STATUS_TTL expires.
     """
     app.logger.info("Request received for plugin status...")
 
-    # 1. Ensure plugins_index.json exists, downloading if it doesn't.
+    # 1. Ensure plugins_index.json and plugins.json exist, creating them if they don't.
     download_plugins_index()
+    check_and_create_installed_plugins_file()
+
+    key = plugin_files_key()
+    now = time.monotonic()
+    if (key == _plugin_status_cache['key']
+            and now - _plugin_status_cache['time'] < PLUGIN_STATUS_TTL):
+        app.logger.info("Returning %s cached plugins.", len(_plugin_status_cache['plugins']))
+        return jsonify({'success': True, 'plugins': _plugin_status_cache['plugins']})
 
     # 2. Get the list of "available" plugins from plugins_index.json
     available_plugins = {}
     try:
-        with open(PLUGINS_INDEX_FILE, 'r') as f:
-            data = json.load(f)
-            if 'plugins' in data and isinstance(data['plugins'], list):
-                for plugin in data['plugins']:
-                    if 'name' in plugin:
-                        available_plugins[plugin['name']] = plugin
+        data = load_json_cached(PLUGINS_INDEX_FILE)
+        if 'plugins' in data and isinstance(data['plugins'], list):
+            for plugin in data['plugins']:
+                if 'name' in plugin:
+                    available_plugins[plugin['name']] = plugin
     except Exception as e:
-        app.logger.error(f"Error reading {PLUGINS_INDEX_FILE}: {e}")
+        app.logger.error("Error reading %s: %s", PLUGINS_INDEX_FILE, e)
         # We can continue, but the list of available plugins might be empty.
 
     # 3. Get the list of "installed" plugins from plugins.json
-    # This also ensures the file is created if it's missing.
-    check_and_create_installed_plugins_file()
     installed_plugins = {}
     try:
-        with open(PLUGINS_INSTALLED_FILE, 'r') as f:
-            data = json.load(f)
-            if 'plugins' in data and isinstance(data['plugins'], list):
-                for plugin in data['plugins']:
-                    if 'name' in plugin:
-                        installed_plugins[plugin['name']] = plugin
+        data = load_json_cached(PLUGINS_INSTALLED_FILE)
+        if 'plugins' in data and isinstance(data['plugins'], list):
+            for plugin in data['plugins']:
+                if 'name' in plugin:
+                    installed_plugins[plugin['name']] = plugin
     except Exception as e:
-        app.logger.error(f"Error reading {PLUGINS_INSTALLED_FILE}: {e}")
+        app.logger.error("Error reading %s: %s", PLUGINS_INSTALLED_FILE, e)
         return jsonify({'success': False, 'plugins': [], 'message': str(e)}), 500
 
     # 4. Get the "live" status from 'plugins.py list'
@@ -579,27 +913,24 @@ def get_plugin_status():
     else:
         plugin_statuses = parse_plugin_list_output(list_result['output'])
     
-    app.logger.info(f"Parsed {len(plugin_statuses)} plugin statuses from 'list' command.")
+    app.logger.info("Parsed %s plugin statuses from 'list' command.", len(plugin_statuses))
 
-    # 5. Merge all sources
-    merged_plugins = {}
-    
-    # Start with available plugins
-    for name, plugin_data in available_plugins.items():
-        merged_plugins[name] = {
-            "name": name,
-            "url": plugin_data.get('url', '-'),
-            "version": "-",
-            "status": "available",
-            "commit": "-"
-        }
-
-    # Update with installed info and live status
-    all_plugin_names = set(available_plugins.keys()) | set(installed_plugins.keys()) | set(plugin_statuses.keys())
-
-    for name in all_plugin_names:
-        if name not in merged_plugins:
-             merged_plugins[name] = {
+    # 5. Merge all sources, visiting names in sorted order so the list needs no sort afterwards
+    all_plugin_names = available_plugins.keys() | installed_plugins.keys() | plugin_statuses.keys()
+    final_plugin_list = []
+
+    for name in sorted(all_plugin_names):
+        if name in available_plugins:
+            # Start with available plugins
+            plugin = {
+                "name": name,
+                "url": available_plugins[name].get('url', '-'),
+                "version": "-",
+                "status": "available",
+                "commit": "-"
+            }
+        else:
+            plugin = {
                 "name": name,
                 "url": installed_plugins.get(name, {}).get('url', '-'),
                 "version": "-",
@@ -607,20 +938,25 @@ def get_plugin_status():
                 "commit": "-"
             }
 
+        # Update with installed info and live status
         status_data = plugin_statuses.get(name)
         if status_data:
             # Plugin is installed according to 'plugins.py list'
-            merged_plugins[name]['version'] = status_data.get('version', '-')
-            merged_plugins[name]['status'] = status_data.get('status', 'installed')
-            merged_plugins[name]['commit'] = status_data.get('commit', '-')
+            plugin['version'] = status_data.get('version', '-')
+            plugin['status'] = status_data.get('status', 'installed')
+            plugin['commit'] = status_data.get('commit', '-')
         elif name in installed_plugins:
             # In plugins.json but not in 'list' output -> likely an error or partially removed
-             merged_plugins[name]['status'] = 'error'
+            plugin['status'] = 'error'
         # If only in available_plugins, status remains 'available'
 
-    final_plugin_list = sorted(list(merged_plugins.values()), key=lambda p: p['name'])
+        final_plugin_list.append(plugin)
+
+    # Only cache a complete answer, so a failed 'list' run is retried on the next request
+    if list_result['success']:
+        _plugin_status_cache.update(key=key, time=now, plugins=final_plugin_list)
         
-    app.logger.info(f"Returning {len(final_plugin_list)} plugins.")
+    app.logger.info("Returning %s plugins.", len(final_plugin_list))
     return jsonify({'success': True, 'plugins': final_plugin_list})
 
 
@@ -632,8 +968,7 @@ def add_plugin():
         return jsonify({'success': False, 'output': 'Error: "url" is required.'}), 400
     
     # Command is: python plugins.py add <repo url>
-    result = run_plugin_script(['add', url])
-    return jsonify(result)
+    return submit_job(run_plugin_script, ['add', url])
 
 @app.route('/api/plugins/remove', methods=['POST'])
 def remove_plugin():
@@ -650,8 +985,7 @@ def remove_plugin():
     if keep_config:
         command_args.append('--keep-config')
         
-    result = run_plugin_script(command_args)
-    return jsonify(result)
+    return submit_job(run_plugin_script, command_args)
 
 @app.route('/api/plugins/update', methods=['POST'])
 def update_plugin():
@@ -660,14 +994,12 @@ def update_plugin():
     if not name:
         return jsonify({'success': False, 'output': 'Error: "name" is required.'}), 400
         
-    result = run_plugin_script(['update', name])
-    return jsonify(result)
+    return submit_job(run_plugin_script, ['update', name])
 
 @app.route('/api/plugins/sync', methods=['POST'])
 def sync_plugins():
     # Runs 'python plugins.py sync'
-    result = run_plugin_script(['sync'])
-    return jsonify(result)
+    return submit_job(run_plugin_script, ['sync'])
     
 # =============================================
 # End of Plugin API Section
@@ -676,15 +1008,55 @@ def sync_plugins():
 # =============================================
 # Supervisor XML-RPC API Endpoints
 # =============================================
+# Connecting to supervisord should be near-instant, so an unreachable
+# supervisor fails fast; calls like stopProcess may take much longer to answer.
+SUPERVISOR_CONNECT_TIMEOUT = 0.2
+SUPERVISOR_TIMEOUT = 15
+
+class TimeoutHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection with a short connect timeout and a longer read timeout."""
+    def __init__(self, host, connect_timeout, timeout):
+        super().__init__(host, timeout=connect_timeout)
+        self.read_timeout = timeout
+
+    def connect(self):
+        super().connect()
+        self.sock.settimeout(self.read_timeout)
+
+class TimeoutTransport(xmlrpc.client.Transport):
+    """XML-RPC transport that opens its keep-alive connection as a TimeoutHTTPConnection."""
+    def __init__(self, connect_timeout, timeout):
+        super().__init__()
+        self.connect_timeout = connect_timeout
+        self.timeout = timeout
+
+    def make_connection(self, host):
+        # Same as Transport.make_connection, with our connection class
+        if self._connection and host == self._connection[0]:
+            return self._connection[1]
+        chost, self._extra_headers, x509 = self.get_host_info(host)
+        self._connection = host, TimeoutHTTPConnection(chost, self.connect_timeout, self.timeout)
+        return self._connection[1]
+
+# One shared proxy for all Supervisor calls. Its Transport keeps the HTTP/1.1
+# connection to supervisord open between calls; the lock serializes access
+# since a ServerProxy and its connection are not thread-safe.
+_SUPERVISOR = xmlrpc.client.ServerProxy(
+    f'http://{SUPERVISOR_URL}:{SUPERVISOR_PORT}/RPC2',
+    transport=TimeoutTransport(SUPERVISOR_CONNECT_TIMEOUT, SUPERVISOR_TIMEOUT),
+    allow_none=True
+)
+_SUPERVISOR_LOCK = threading.Lock()
+
 @app.route('/api/supervisor/processes', methods=['GET'])
 def api_supervisor_processes():
     """Fetches all process info from Supervisor."""
     try:
-        with xmlrpc.client.ServerProxy(f'http://{SUPERVISOR_URL}:{SUPERVISOR_PORT}/RPC2') as proxy:
-            processes = proxy.supervisor.getAllProcessInfo()
-            return jsonify({'success': True, 'processes': processes})
+        with _SUPERVISOR_LOCK:
+            processes = _SUPERVISOR.supervisor.getAllProcessInfo()
+        return jsonify({'success': True, 'processes': processes})
     except Exception as e:
-        app.logger.error(f"XML-RPC Error: {e}")
+        app.logger.error("XML-RPC Error: %s", e)
         return jsonify({'success': False, 'message': str(e)}), 500
 
 @app.route('/api/supervisor/start', methods=['POST'])
@@ -692,11 +1064,11 @@ def api_supervisor_start():
     """Starts a process via Supervisor."""
     name = request.json.get('name')
     try:
-        with xmlrpc.client.ServerProxy(f'http://{SUPERVISOR_URL}:{SUPERVISOR_PORT}/RPC2') as proxy:
-            result = proxy.supervisor.startProcess(name)
-            return jsonify({'success': True, 'result': result})
+        with _SUPERVISOR_LOCK:
+            result = _SUPERVISOR.supervisor.startProcess(name)
+        return jsonify({'success': True, 'result': result})
     except Exception as e:
-        app.logger.error(f"XML-RPC Start Error: {e}")
+        app.logger.error("XML-RPC Start Error: %s", e)
         return jsonify({'success': False, 'message': str(e)}), 500
 
 @app.route('/api/supervisor/stop', methods=['POST'])
@@ -704,11 +1076,11 @@ def api_supervisor_stop():
     """Stops a process via Supervisor."""
     name = request.json.get('name')
     try:
-        with xmlrpc.client.ServerProxy(f'http://{SUPERVISOR_URL}:{SUPERVISOR_PORT}/RPC2') as proxy:
-            result = proxy.supervisor.stopProcess(name)
-            return jsonify({'success': True, 'result': result})
+        with _SUPERVISOR_LOCK:
+            result = _SUPERVISOR.supervisor.stopProcess(name)
+        return jsonify({'success': True, 'result': result})
     except Exception as e:
-        app.logger.error(f"XML-RPC Stop Error: {e}")
+        app.logger.error("XML-RPC Stop Error: %s", e)
         return jsonify({'success': False, 'message': str(e)}), 500
 
 @app.route('/api/supervisor/tail_stderr', methods=['POST'])
@@ -719,16 +1091,85 @@ def api_supervisor_tail_stderr():
     offset = -4096 
     length = 4096
     try:
-        with xmlrpc.client.ServerProxy(f'http://{SUPERVISOR_URL}:{SUPERVISOR_PORT}/RPC2') as proxy:
+        with _SUPERVISOR_LOCK:
             # Returns [log_data, offset, overflow]
-            result = proxy.supervisor.tailProcessStderrLog(name, offset, length)
-            return jsonify({'success': True, 'log': result[0], 'offset': result[1], 'overflow': result[2]})
+            result = _SUPERVISOR.supervisor.tailProcessStderrLog(name, offset, length)
+        return jsonify({'success': True, 'log': result[0], 'offset': result[1], 'overflow': result[2]})
     except Exception as e:
-        app.logger.error(f"XML-RPC Log Error: {e}")
+        app.logger.error("XML-RPC Log Error: %s", e)
         return jsonify({'success': False, 'message': str(e)}), 500
 # =============================================
 
 # --- Page Serving ---
+PAGE_MAX_AGE = 3600
+# Brotli's default quality (11) takes seconds on a Pi for the pages and assets;
+# 5 compresses them in a fraction of that, only ~15% larger
+BROTLI_QUALITY = 5
+
+def encoded_variants(body):
+    """
+    Returns body with its gzip and Brotli (if available) encodings
+    as {encoding: (body, etag)}, so they are compressed only once.
+    """
+    etag = blob_etag(body)
+    variants = {
+        'identity': (body, etag),
+        'gzip': (gzip.compress(body, compresslevel=9, mtime=0), f"{etag}-gzip")
+    }
+    if brotli:
+        variants['br'] = (brotli.compress(body, quality=BROTLI_QUALITY), f"{etag}-br")
+    return variants
+
+def variant_response(variants, mimetype):
+    """Builds a response from the best pre-encoded body in variants that the client accepts."""
+    encoding = request.accept_encodings.best_match([e for e in ('br', 'gzip') if e in variants])
+    body, etag = variants[encoding or 'identity']
+    response = Response(body, mimetype=mimetype)
+    if encoding:
+        # Flask-Compress leaves responses that already have a Content-Encoding alone
+        response.headers['Content-Encoding'] = encoding
+    if len(variants) > 1:
+        response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    return response
+
+def load_page_cache():
+    """
+    Reads every HTML page in TEMPLATES_DIR into memory, along with gzip and
+    Brotli (if available) encodings, as {filename: {encoding: (body, etag)}}.
+    """
+    pages = {}
+    try:
+        filenames = [name for name in os.listdir(TEMPLATES_DIR) if name.endswith('.html')]
+    except OSError as e:
+        logging.error("Could not list %s: %s", TEMPLATES_DIR, e)
+        return pages
+    for filename in filenames:
+        with open(os.path.join(TEMPLATES_DIR, filename), 'rb') as f:
+            pages[filename] = encoded_variants(f.read())
+    return pages
+
+# The pages only change on deploy, so they are read once at startup
+_PAGE_CACHE = load_page_cache()
+
+def serve_page(filename, max_age=PAGE_MAX_AGE):
+    """
+    Serves an HTML page from the in-memory page cache, or an empty
+    304 Not Modified if the client's If-None-Match already matches.
+    With max_age=None the browser must revalidate on every visit.
+    """
+    variants = _PAGE_CACHE.get(filename)
+    if variants is None or args.debug:
+        # Missing pages 404 as before; debug mode reads from disk so template edits show up
+        return send_from_directory(TEMPLATES_DIR, filename)
+
+    response = variant_response(variants, 'text/html')
+    if max_age is None:
+        response.cache_control.no_cache = True
+    else:
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+    return response.make_conditional(request)
 
 @app.route('/')
 def index():
@@ -738,10 +1179,11 @@ def index():
     """
     # Bypass setup check if in debug mode
     if check_first_run() and not args.debug:
-        app.logger.info(f"SETUP file found. Serving setup.html for {request.remote_addr}")
-        return send_from_directory(TEMPLATES_DIR, 'setup.html') 
+        app.logger.info("SETUP file found. Serving setup.html for %s", request.remote_addr)
+        return serve_page('setup.html', max_age=None)
         
-    return send_from_directory(TEMPLATES_DIR, 'index.html')
+    # The page at this URL depends on the SETUP file, so browsers must revalidate it
+    return serve_page('index.html', max_age=None)
 
 @app.route('/setup')
 def setup_page():
@@ -749,36 +1191,99 @@ def setup_page():
     # Bypass setup check if in debug mode
     if not check_first_run() and not args.debug:
         app.logger.info("Access to /setup denied, redirecting to /")
-        return send_from_directory(TEMPLATES_DIR, 'index.html') 
+        return serve_page('index.html', max_age=None)
     
-    app.logger.info(f"Serving setup.html (Debug: {args.debug})")
-    return send_from_directory(TEMPLATES_DIR, 'setup.html') 
+    app.logger.info("Serving setup.html (Debug: %s)", args.debug)
+    return serve_page('setup.html', max_age=None)
 
 
 @app.route('/config')
 def config_page():
     """Serves the configurator page."""
-    return send_from_directory(TEMPLATES_DIR, 'config.html') 
+    return serve_page('config.html')
 
 @app.route('/utilities')
 def utilities_page():
     """Serves the placeholder utilities page."""
-    return send_from_directory(TEMPLATES_DIR, 'utilities.html') 
+    return serve_page('utilities.html')
 
 @app.route('/plugins')
 def plugins_page():
     """Serves the new plugins page."""
-    return send_from_directory(TEMPLATES_DIR, 'plugins.html')
+    return serve_page('plugins.html')
 
 @app.route('/supervisor')
 def supervisor_page():
     """Serves the supervisor embed page."""
-    return send_from_directory(TEMPLATES_DIR, 'supervisor_rpc.html') 
+    return serve_page('supervisor_rpc.html')
+
+# Asset types worth pre-compressing; PNG/JPEG images are already compressed
+COMPRESSIBLE_MIMETYPES = (
+    'application/javascript', 'application/json', 'image/svg+xml',
+    'image/vnd.microsoft.icon', 'image/x-icon'
+)
+
+def load_asset_cache():
+    """
+    Reads every file under ASSETS_DIR into memory as
+    {relative/path: (mimetype, {encoding: (body, etag)})}.
+    """
+    assets = {}
+    for root, _, filenames in os.walk(ASSETS_DIR):
+        for filename in filenames:
+            full_path = os.path.join(root, filename)
+            rel_path = os.path.relpath(full_path, ASSETS_DIR).replace(os.sep, '/')
+            mimetype = mimetypes.guess_type(rel_path)[0] or 'application/octet-stream'
+            with open(full_path, 'rb') as f:
+                body = f.read()
+            if mimetype.startswith('text/') or mimetype in COMPRESSIBLE_MIMETYPES:
+                variants = encoded_variants(body)
+            else:
+                variants = {'identity': (body, blob_etag(body))}
+            assets[rel_path] = (mimetype, variants)
+    return assets
+
+# The assets (about 650KB) only change on deploy, so they are read once at startup
+# and served from memory with content-hash ETags
+_ASSET_CACHE = load_asset_cache()
+# Any other path is a 404 without touching the disk
+_VALID_ASSETS = frozenset(_ASSET_CACHE)
+_ASSET_NOT_FOUND = ('Not Found', 404, {'Cache-Control': f'public, max-age={PAGE_MAX_AGE}'})
+
+# nginx `internal` location that aliases ASSETS_DIR (see packaging/nginx_controlhub.conf)
+ASSETS_INTERNAL_LOCATION = '/_assets_internal/'
 
 @app.route('/assets/<path:path>')
 def send_asset(path):
     """Serves files from the assets directory (like the logo)."""
-    return send_from_directory(ASSETS_DIR, path) 
+    # Debug mode skips the startup listing so newly added assets can be served
+    if path not in _VALID_ASSETS and not args.debug:
+        return _ASSET_NOT_FOUND
+    if USE_XSENDFILE:
+        # In debug mode the path hasn't been checked against the listing above, so make
+        # sure it stays inside ASSETS_DIR before handing it to nginx
+        if args.debug and safe_join(ASSETS_DIR, path) is None:
+            return _ASSET_NOT_FOUND
+        # nginx sends the file itself with sendfile(2)
+        response = Response()
+        response.headers['X-Accel-Redirect'] = ASSETS_INTERNAL_LOCATION + urllib.parse.quote(path)
+        response.headers['Content-Type'] = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        return response
+    if args.debug:
+        return send_from_directory(ASSETS_DIR, path)
+
+    mimetype, variants = _ASSET_CACHE[path]
+    response = variant_response(variants, mimetype)
+    response.cache_control.public = True
+    response.cache_control.max_age = ASSET_MAX_AGE
+    return response.make_conditional(request)
+
+@app.after_request
+def add_asset_cache_headers(response):
+    """Marks assets as immutable so browsers skip revalidating them between pages."""
+    if request.path.startswith('/assets/') and response.status_code in (200, 304):
+        response.headers['Cache-Control'] = f'public, max-age={ASSET_MAX_AGE}, immutable'
+    return response
 
 
 # --- Run the Server ---
@@ -789,10 +1294,21 @@ if __name__ == '__main__':
         app.logger.warning("Setup and Supervisor checks will be bypassed.")
         app.logger.warning("="*50)
         
-    app.logger.info(f"Starting NHL Scoreboard Config Server on port {PORT}")
-    app.logger.info(f"Serving HTML files from: {TEMPLATES_DIR}")
-    app.logger.info(f"Serving Assets from: {ASSETS_DIR}")
-    app.logger.info(f"Access at http://[YOUR_PI_IP]:{PORT} in your browser.")
+    app.logger.info("Starting NHL Scoreboard Config Server on port %s", PORT)
+    app.logger.info("Serving HTML files from: %s", TEMPLATES_DIR)
+    app.logger.info("Serving Assets from: %s", ASSETS_DIR)
+    app.logger.info("Access at http://[YOUR_PI_IP]:%s in your browser.", PORT)
     
-    # Use the debug flag from args
-    app.run(host='0.0.0.0', port=PORT, debug=args.debug)
\ No newline at end of file
+    if args.debug:
+        # Werkzeug's development server, with the debugger and reloader
+        app.run(host='0.0.0.0', port=PORT, debug=True)
+    else:
+        try:
+            from waitress import serve
+        except ImportError:
+            app.logger.warning("waitress is not installed, falling back to the Flask development server.")
+            app.run(host='0.0.0.0', port=PORT)
+        else:
+            # Production WSGI server: a pool of request threads so slow supervisor
+            # or plugin calls don't block the rest of the UI
+            serve(app, host='0.0.0.0', port=PORT, threads=8, connection_limit=200)
\ No newline at end of file
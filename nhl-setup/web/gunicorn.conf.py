@@ -0,0 +1,15 @@
+# Gunicorn settings for the Control Hub: gunicorn -c gunicorn.conf.py wsgi:app
+# Importing wsgi here loads the app once in the master (same as preload_app),
+# so the page and asset caches are built before the worker is forked.
+from wsgi import PORT
+
+bind = f'0.0.0.0:{PORT}'
+# Keep a single worker: background jobs (/api/jobs/<job_id>) and the response
+# caches live in process memory, so a second worker would not see them.
+workers = 1
+worker_class = 'gthread'
+threads = 8
+keepalive = 30
+preload_app = True
+# Plugin commands run as background jobs, but allow for slow supervisor calls
+timeout = 60
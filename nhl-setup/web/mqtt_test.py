@@ -1,74 +1,124 @@
 import argparse
+import functools
+import socket
 import sys
+import threading
 import time
 
 try:
     import paho.mqtt.client as mqtt
 except ImportError:
-    # Print 'no' if library is missing, or print helpful error to stderr
-    sys.stderr.write("Error: 'paho-mqtt' library not found. Install with: pip install paho-mqtt\n")
-    print("no")
-    sys.exit(1)
+    # Reported by mqtt_reachable() so config_server can still import this module
+    mqtt = None
 
-def on_connect(client, userdata, flags, rc, properties=None):
+# Seconds to wait for the broker's name to resolve
+DNS_TIMEOUT = 2.0
+
+@functools.lru_cache(maxsize=64)
+def lookup_broker(broker, port):
+    """
+    Returns the first IP address broker resolves to. Failed lookups are not
+    cached, and mqtt_reachable() clears the cache when a connection fails.
+    """
+    return socket.getaddrinfo(broker, port, type=socket.SOCK_STREAM)[0][4][0]
+
+def resolve_broker(broker, port):
+    """
+    Resolves broker to an IP address, or returns None if it doesn't resolve
+    within DNS_TIMEOUT seconds (getaddrinfo ignores socket timeouts, so the
+    lookup runs on a daemon thread that is abandoned if it hangs).
+    """
+    result = []
+
+    def lookup():
+        try:
+            result.append(lookup_broker(broker, port))
+        except OSError:
+            pass
+
+    thread = threading.Thread(target=lookup, daemon=True)
+    thread.start()
+    thread.join(DNS_TIMEOUT)
+    return result[0] if result else None
+
+def on_connect(client, userdata, flags, reason_code, properties):
     """
     Callback for when the client receives a CONNACK response from the server.
-    rc = 0 means connection successful.
+    A reason code of 0 means connection successful.
     """
-    userdata['finished'] = True
-    if rc == 0:
+    if reason_code == 0:
         userdata['status'] = "yes"
     else:
         userdata['status'] = "no"
+    userdata['done'].set()
 
-def main():
-    parser = argparse.ArgumentParser(description='Test MQTT Connectivity stub')
-    parser.add_argument('broker', type=str, help='Broker address (e.g., localhost or 192.168.1.50)')
-    parser.add_argument('port', type=int, help='Broker port (e.g., 1883)')
-    parser.add_argument('-u', '--username', type=str, help='MQTT Username', default=None)
-    parser.add_argument('-p', '--password', type=str, help='MQTT Password', default=None)
+def mqtt_reachable(broker, port, username=None, password=None, timeout=5):
+    """
+    Connects to the broker and returns True if it accepts the connection
+    within timeout seconds. Raises RuntimeError if paho-mqtt is missing.
+    """
+    if mqtt is None:
+        raise RuntimeError("'paho-mqtt' library not found. Install with: pip install paho-mqtt")
 
-    args = parser.parse_args()
+    # Bail out before creating a client if the broker's name doesn't resolve
+    broker_ip = resolve_broker(broker, port)
+    if broker_ip is None:
+        return False
 
-    # Dictionary to share state between main thread and callback
-    connection_state = {'status': "no", 'finished': False}
+    # Dictionary to share state between the network loop and callback; the
+    # event ends the loop as soon as the CONNACK arrives
+    connection_state = {'status': "no", 'done': threading.Event()}
 
     try:
-        # Initialize client. 
-        # Note: We are using a basic initialization compatible with most paho versions.
-        # If using paho-mqtt 2.0+, it might emit a warning about CallbackAPIVersion, 
-        # but will still function for this test.
-        client = mqtt.Client(userdata=connection_state)
-        
+        client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, userdata=connection_state)
         client.on_connect = on_connect
+        # Fail fast on unreachable brokers instead of waiting on the TCP connect
+        client.connect_timeout = 1.0
 
-        if args.username and args.password:
-            client.username_pw_set(args.username, args.password)
+        if username and password:
+            client.username_pw_set(username, password)
 
         # Attempt connection
-        client.connect(args.broker, args.port, keepalive=10)
-        
-        # Start the network loop in a background thread
-        client.loop_start()
-
-        # Wait up to 5 seconds for the on_connect callback
-        timeout = 5
-        start_time = time.time()
-        
-        while not connection_state['finished']:
-            if time.time() - start_time > timeout:
+        client.connect(broker_ip, port, keepalive=10)
+
+        # Run the network loop on this thread (there is only the CONNACK to read)
+        # until the on_connect callback fires. Any error (e.g. the broker closed the
+        # connection without a CONNACK) ends the test, rather than retrying at once.
+        deadline = time.monotonic() + timeout
+        while not connection_state['done'].is_set() and time.monotonic() < deadline:
+            if client.loop(timeout=0.1) != mqtt.MQTT_ERR_SUCCESS:
                 break
-            time.sleep(0.1)
 
-        client.loop_stop()
         client.disconnect()
+    except Exception:
+        # Connection refused, timeouts, etc.
+        pass
 
-        # Output the result
-        print(connection_state['status'])
+    if connection_state['status'] != "yes":
+        # The broker may have moved to another address, so look it up again next time
+        lookup_broker.cache_clear()
+        return False
+    return True
 
-    except Exception:
-        # Catch DNS errors, connection refused errors, etc.
+def main():
+    parser = argparse.ArgumentParser(description='Test MQTT Connectivity stub')
+    parser.add_argument('broker', type=str, help='Broker address (e.g., localhost or 192.168.1.50)')
+    parser.add_argument('port', type=int, help='Broker port (e.g., 1883)')
+    parser.add_argument('-u', '--username', type=str, help='MQTT Username', default=None)
+    parser.add_argument('-p', '--password', type=str, help='MQTT Password', default=None)
+
+    args = parser.parse_args()
+
+    try:
+        reachable = mqtt_reachable(args.broker, args.port, args.username, args.password)
+    except RuntimeError as e:
+        # Print 'no' if library is missing, with a helpful error on stderr
+        sys.stderr.write(f"Error: {e}\n")
         print("no")
+        sys.exit(1)
+
+    # Output the result
+    print("yes" if reachable else "no")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,20 @@
+"""
+WSGI entry point for running the Control Hub under Gunicorn (see gunicorn.conf.py).
+
+config_server.py reads its options from the command line, which under Gunicorn
+holds Gunicorn's own arguments, so they are taken from environment variables instead:
+    NLS_CONTROLHUB_CONFIG   Path to the TOML configuration file (same as --config)
+    NLS_SCOREBOARD_DIR      Path to the nhl-led-scoreboard directory (same as --scoreboard_dir)
+"""
+import os
+import sys
+
+sys.argv = [sys.argv[0]]
+if os.environ.get('NLS_CONTROLHUB_CONFIG'):
+    sys.argv += ['--config', os.environ['NLS_CONTROLHUB_CONFIG']]
+if os.environ.get('NLS_SCOREBOARD_DIR'):
+    sys.argv += ['--scoreboard_dir', os.environ['NLS_SCOREBOARD_DIR']]
+
+from config_server import app, PORT  # noqa: E402
+
+__all__ = ['app', 'PORT']